@@ -3,42 +3,36 @@
 import pandas as pd
 import numpy as np
 
-df = pd.read_csv('../../peptides_compounds.tsv', sep='\t')
+df = pd.read_pickle('../../peptides_compounds.pkl')
 
 
-dup = df.copy()
-dup.pop('description')
-dup.pop('accession')
-dup.pop('site')
-
-df = df[~dup.duplicated()]
+dup = df.duplicated(subset=[c for c in df.columns if c not in {'description', 'accession', 'site'}])
+df = df[~dup]
 
 cmpds = df.columns[6:]
 print(cmpds)
-# Count how many proteins are liganded in each chemotype or compound
-data = dict()
-for c in cmpds:
-    c = c.split('_')[0]
-    data[c] = {'liganded': 0}
+prefixes = [c.split('_')[0] for c in cmpds]
 
-# Keep track of which compounds (vlaues) target which proteins (key)
-liganded_by = {}
+# Peptides (rows) liganded by each compound (columns)
+mat = df[cmpds].to_numpy() >= 4.0
 
-for index, row in df.iterrows():
-    for c in cmpds:
-        if row[c] >= 4.0:
-            c = c.split('_')[0]
-            print(row['accession'], c)
-            data[c]['liganded'] = data[c]['liganded'] + 1
-            liganded_by[row['accession']] = liganded_by.get(
-                row['accession'], []) + [c]
+# Count how many proteins are liganded in each chemotype or compound
+hits = pd.Series(mat.sum(axis=0), index=prefixes).groupby(level=0, sort=False).sum()
+data = {c: {'liganded': int(n)} for c, n in hits.items()}
 
+# Peptides (rows) liganded by each chemotype (columns)
+order = np.argsort(prefixes, kind='stable')
+chemotypes, starts = np.unique(np.asarray(prefixes)[order], return_index=True)
+chemo = np.logical_or.reduceat(mat[:, order], starts, axis=1)
 
-# Go through each protein, and count how many compounds have ratios >= 4
-ligand_counts = [0 for i in range(10)]
-for acc, ligands in liganded_by.items():
-    ligand_counts[min(10, len(ligands)) - 1] += 1
+# Keep track of which chemotypes (columns) target which proteins (rows)
+acc_codes, accessions = pd.factorize(df['accession'])
+liganded_by = np.zeros((len(accessions), len(chemotypes)), dtype=bool)
+np.logical_or.at(liganded_by, acc_codes, chemo)
 
+# Go through each protein, and count how many compounds have ratios >= 4
+ligands = liganded_by.sum(axis=1)
+ligand_counts = np.bincount(np.minimum(ligands[ligands > 0], 10) - 1, minlength=10)
 
 df = pd.DataFrame({'Distinct chemotypes': [x+1 for x in range(10)], 'Number of liganded lysines': ligand_counts})
 df.to_csv('figure 2b left.csv')
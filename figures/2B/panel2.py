@@ -3,31 +3,23 @@
 import pandas as pd
 import numpy as np
 
-df = pd.read_csv('../../proteins_chemotypes.tsv', sep='\t')
+df = pd.read_pickle('../../proteins_chemotypes.pkl')
 cmpds = df.columns[4:]
 print(cmpds)
-# Count how many proteins are liganded in each chemotype or compound
-data = dict()
-for c in cmpds:
-    data[c] = {'liganded': 0}
-
-# Keep track of which compounds (vlaues) target which proteins (key)
-liganded_by = {}
+# Proteins (rows) liganded by each chemotype (columns)
+mat = df[cmpds].to_numpy() >= 4.0
 
-for index, row in df.iterrows():
-    for c in cmpds:
-        if float(row[c]) >= 4.0:
-            data[c]['liganded'] = data[c]['liganded'] + 1
-            liganded_by[row['accession']] = liganded_by.get(
-                row['accession'], []) + [c]
+# Count how many proteins are liganded in each chemotype or compound
+data = {c: {'liganded': int(n)} for c, n in zip(cmpds, mat.sum(axis=0))}
 
+# Keep track of which compounds (columns) target which proteins (rows)
+acc_codes, accessions = pd.factorize(df['accession'])
+liganded_by = np.zeros((len(accessions), len(cmpds)), dtype=bool)
+np.logical_or.at(liganded_by, acc_codes, mat)
 
 # Go through each protein, and count how many compounds have ratios >= 4
-ligand_counts = [0 for i in range(10)]
-for acc, ligands in liganded_by.items():
-    # print(acc,ligands)
-    ligand_counts[min(10, len(ligands)) - 1] += 1
-
+ligands = liganded_by.sum(axis=1)
+ligand_counts = np.bincount(np.minimum(ligands[ligands > 0], 10) - 1, minlength=10)
 
 df = pd.DataFrame({'Distinct chemotypes': [x+1 for x in range(10)], 'Number of liganded proteins': ligand_counts})
 df.to_csv('figure 2b right.csv')
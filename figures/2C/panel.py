@@ -1,30 +1,19 @@
 import pandas as pd 
 import numpy as np 
 
-df = pd.read_csv('../../peptides_chemotypes.tsv', sep='\t')
-dup = df.copy()
-dup.pop('description')
-dup.pop('accession')
-dup.pop('site')
-
-df = df[~dup.duplicated()]
+df = pd.read_pickle('../../peptides_chemotypes.pkl')
+dup = df.duplicated(subset=[c for c in df.columns if c not in {'description', 'accession', 'site'}])
+df = df[~dup]
 chemotypes = df.columns[7:]
 print(chemotypes)
 
-data = {}
-for c in chemotypes:
-    data[c] = dict(unique=0, shared=0)
+# Peptides (rows) liganded by each chemotype (columns), and how many
+# chemotypes ligand each peptide
+mat = df[chemotypes].to_numpy() >= 4.0
+row_hits = mat.sum(axis=1)
 
-for idx, row in df.iterrows():
-    liganding_chemotypes = []
-    for c in chemotypes:
-        if row[c] >= 4.0:
-            liganding_chemotypes.append(c)
-    for c in liganding_chemotypes:
-        if len(liganding_chemotypes) == 1:
-            data[c]['unique'] = data[c]['unique'] + 1
-        else:
-            data[c]['shared'] = data[c]['shared'] + 1
+unique = mat[row_hits == 1].sum(axis=0)
+shared = mat[row_hits > 1].sum(axis=0)
 
-df = pd.DataFrame(data).T 
+df = pd.DataFrame({'unique': unique, 'shared': shared}, index=chemotypes)
 df.to_csv('figure 2c.csv')
\ No newline at end of file
@@ -1,45 +1,23 @@
 import pandas as pd
 import numpy as np
 
-df = pd.read_csv('../../peptides_chemotypes.tsv', sep='\t')
-dup = df.copy()
-dup.pop('description')
-dup.pop('accession')
-dup.pop('site')
-
-df = df[~dup.duplicated()]
-yes = 0
-no = 0
-
-def any(arr, pred):
-    p = False
-    for a in arr:
-        if pred(a):
-            p = True 
-    return p
-
-for index, row in df.iterrows():
-    if any(row[5:], (lambda x: x >= 4)):
-        yes += 1
-    else:
-        no += 1
-            
+df = pd.read_pickle('../../peptides_chemotypes.pkl')
+dup = df.duplicated(subset=[c for c in df.columns if c not in {'description', 'accession', 'site'}])
+df = df[~dup]
+liganded = df.iloc[:, 5:].to_numpy() >= 4
+yes = int(liganded.any(axis=1).sum())
+no = len(df) - yes
 
 # df = pd.DataFrame({'Liganded peptides': yes, 'Unliganded peptides': no})
-open('figure 4a left.csv', 'w').write('Liganded peptides, {}\nUnliganded peptides, {}\n'.format(yes, no))
-
+open('figure 4a left.csv', 'w').write(f'Liganded peptides, {yes}\nUnliganded peptides, {no}\n')
 
-df = pd.read_csv('../../proteins_chemotypes.tsv', sep='\t')
-yes = 0
-no = 0
 
-for index, row in df.iterrows():
-    if any(row[3:], (lambda x: x >= 4)):
-        yes += 1
-    else:
-        no += 1
+df = pd.read_pickle('../../proteins_chemotypes.pkl')
+liganded = df.iloc[:, 3:].to_numpy() >= 4
+yes = int(liganded.any(axis=1).sum())
+no = len(df) - yes
 
 
 # df = pd.DataFrame({'Liganded peptides': yes, 'Unliganded peptides': no})
 open('figure 4a right.csv', 'w').write(
-    'Liganded proteins, {}\nUnliganded proteins, {}\n'.format(yes, no))
+    f'Liganded proteins, {yes}\nUnliganded proteins, {no}\n')
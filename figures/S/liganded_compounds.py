@@ -1,37 +1,42 @@
 import pandas as pd
 import numpy as np
 import json 
+import re
 
 codes = json.loads(open('manuscript_codes.json', 'r').read())
+# Longest codes first, so that e.g. DAPG10 wins over DAPG1
+codes_re = re.compile('|'.join(sorted(map(re.escape, codes), key=len, reverse=True)))
 print(codes)
 
-def try_match(s: str, dictionary): 
+def try_match(s: str, dictionary, pattern): 
     if s in dictionary:
         return dictionary[s]
-    else:
-        for (k, v) in dictionary.items():
-            if k in s:
-                return v
+    m = pattern.search(s)
+    if m is not None:
+        return dictionary[m.group()]
     return None
 
 df = pd.read_csv('../../peptides_compounds.tsv', sep='\t')
 print(df)
-cmpds = list(map(lambda x: try_match(x.split('_')[0], codes), df.columns[7:]))
+cmpds = list(map(lambda x: try_match(x.split('_')[0], codes, codes_re), df.columns[7:]))
 print(cmpds)
-def f(row):
-    r = pd.Series()
-    r['accession'] = row['accession']
-    r['gene_name'] = row['description'].split(' ')[0]
-    r['description'] = row['description']
-    r['sequence'] = row['sequence']
-    r['site'] = row['site']
-    r['max_ratio'] = row['max_ratio']
-    r['average_ratio'] = row['average_ratio']
-    hits = set(map(lambda x: x[1], filter(lambda x: x[0] >= 4, zip(row[7:], cmpds))))
-    # map #2 (filter )
-    r['hit_compounds'] = ','.join(hits)
-    return r
 
-df2 = df.apply(f, axis=1)
+# Peptides (rows) liganded by each compound (columns), with the columns of
+# a compound tested at several concentrations merged under its code
+mat = df.iloc[:, 7:].to_numpy(dtype=float) >= 4
+mat = pd.DataFrame(mat, columns=cmpds).T.groupby(level=0).any().T
+cmpd_arr = mat.columns.to_numpy(dtype=object)
+hits = [','.join(np.compress(row, cmpd_arr)) for row in mat.to_numpy()]
+
+df2 = pd.DataFrame({
+    'accession': df['accession'],
+    'gene_name': df['description'].str.split(' ', n=1).str[0],
+    'description': df['description'],
+    'sequence': df['sequence'],
+    'site': df['site'],
+    'max_ratio': df['max_ratio'],
+    'average_ratio': df['average_ratio'],
+    'hit_compounds': hits,
+})
 df2.to_csv('hit_compounds.csv')
 print(df2)
@@ -1,30 +1,35 @@
 import pandas as pd
 import numpy as np
 import json 
+import re
+from collections import Counter, defaultdict
 
 codes = json.loads(open('manuscript_codes.json', 'r').read())
+# Longest codes first, so that e.g. DAPG10 wins over DAPG1
+codes_re = re.compile('|'.join(sorted(map(re.escape, codes), key=len, reverse=True)))
 # print(codes)
 
-def try_match(s: str, dictionary): 
+def try_match(s: str, dictionary, pattern): 
     if '_' not in s:
         return s
     name = s.split('_')[0]
     conc = s.split('_')[1]
     if name in dictionary:
         return dictionary[name] + '_' + conc
-    else:
-        for (k, v) in dictionary.items():
-            if k in name:
-                return v + '_' + conc
+    m = pattern.search(name)
+    if m is not None:
+        return dictionary[m.group()] + '_' + conc
     return name
 
 cells = set(['231', 'Ramos'])
 
-counts = dict()
+counts = defaultdict(Counter)
+
+# Strip the MIKA- prefix and .combined extension from experiment names
+expt_re = re.compile(r'MIKA-|\.combined')
 
 with open('expts', 'r') as f:
-    # data = f.read()
-    data = [x.split('/')[1].strip().replace('MIKA-', '').replace('.combined', '') for x in f.readlines()]
+    data = (expt_re.sub('', x.split('/', 2)[1].strip()) for x in f)
 
     for x in data:
         xs = x.split('_')
@@ -36,15 +41,13 @@ with open('expts', 'r') as f:
             elif val in cells:
                 cell = val 
             elif cmpd is None:
-                for (k, v) in codes.items():
-                    if k in val:
-                        cmpd=v
+                m = codes_re.search(val)
+                if m is not None:
+                    cmpd = codes[m.group()]
 
             
         if cmpd is not None and cell is not None:
-            tmp = counts.get(cmpd, dict())
-            tmp[cell] = tmp.get(cell, 0) + 1
-            counts[cmpd] = tmp
+            counts[cmpd][cell] += 1
         else:
             print(x, cmpd, cell)
 
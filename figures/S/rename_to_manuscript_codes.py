@@ -1,27 +1,29 @@
 import pandas as pd
 import numpy as np
 import json 
+import re
 
 codes = json.loads(open('manuscript_codes.json', 'r').read())
+# Longest codes first, so that e.g. DAPG10 wins over DAPG1
+codes_re = re.compile('|'.join(sorted(map(re.escape, codes), key=len, reverse=True)))
 print(codes)
 
-def try_match(s: str, dictionary): 
+def try_match(s: str, dictionary, pattern): 
     if '_' not in s:
         return s
     name = s.split('_')[0]
     conc = s.split('_')[1]
     if name in dictionary:
         return dictionary[name] + '_' + conc
-    else:
-        for (k, v) in dictionary.items():
-            if k in name:
-                return v + '_' + conc
+    m = pattern.search(name)
+    if m is not None:
+        return dictionary[m.group()] + '_' + conc
     return name
 
 df = pd.read_csv('../../peptides_compounds.tsv', sep='\t')
 print(df)
 
-df = df.rename(lambda x: try_match(x, codes), axis="columns")
-df['gene_name'] = df.apply(lambda x: x['description'].split(' ')[0], axis=1)
+df = df.rename(lambda x: try_match(x, codes, codes_re), axis="columns")
+df['gene_name'] = df['description'].str.split(' ', n=1).str[0]
 df.to_csv('renamed.csv')
 print(df)
\ No newline at end of file
@@ -1,12 +1,9 @@
-import os
+import pathlib
 import zipfile
 import pandas as pd 
 
-z = zipfile.ZipFile('figures.zip', 'w')
+with zipfile.ZipFile('figures.zip', 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as z:
+    for p in sorted(pathlib.Path('.').rglob('*.csv')):
+        z.write(p, arcname=p.name)
 
-for root, dirs, files in os.walk('.'):
-    for name in files:
-        if '.csv' in name:
-            z.write('{}\\{}'.format(root,name), arcname=name)
-
-z.write('processed_excel.xlsx', arcname='processed_excel.xlsx')
\ No newline at end of file
+    z.write('processed_excel.xlsx', arcname='processed_excel.xlsx')
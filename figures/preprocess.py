@@ -0,0 +1,18 @@
+# Convert the processed TSVs into pickled DataFrames, so the figure panels
+# don't have to parse and type the text files every time they run
+import pandas as pd
+import numpy as np
+
+# Number of leading text columns in each file, the rest are ratios
+tables = {
+    'peptides_compounds': 5,
+    'peptides_chemotypes': 5,
+    'proteins_chemotypes': 2,
+}
+
+for name, start in tables.items():
+    path = '../{}.tsv'.format(name)
+    columns = pd.read_csv(path, sep='\t', nrows=0).columns
+    # Ratios are only compared against the 4.0 cutoff, so float32 is plenty
+    df = pd.read_csv(path, sep='\t', dtype={'accession': 'category', **{c: np.float32 for c in columns[start:]}})
+    df.to_pickle('../{}.pkl'.format(name))